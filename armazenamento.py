@@ -0,0 +1,265 @@
+"""
+📦 Interface de Armazenamento - Mestre RPG
+Contrato comum para fichas, sessões e combate, mais um motor em memória
+"""
+
+import copy
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class ErroArmazenamento(Exception):
+    """Base dos erros de armazenamento"""
+
+
+class NaoEncontrado(ErroArmazenamento):
+    """O registro não existe (ou não pertence a quem pediu)"""
+
+
+class FalhaArmazenamento(ErroArmazenamento):
+    """O armazenamento em si falhou (disco, lock, restrição violada...)"""
+
+
+# Campos de ficha que podem ser alterados por atualizar_ficha
+CAMPOS_FICHA_EDITAVEIS = (
+    'nome_personagem', 'classe', 'nivel', 'raca',
+    'forca', 'destreza', 'constituicao', 'inteligencia',
+    'sabedoria', 'carisma', 'pv_max', 'pv_atual', 'experiencia',
+)
+
+# Campos de combate que podem ser alterados por atualizar_combate
+CAMPOS_COMBATE_EDITAVEIS = ('turno', 'rodada', 'participante_atual', 'participantes')
+
+
+class Armazenamento(ABC):
+    """Operações que o bot precisa do armazenamento
+
+    Buscas sem resultado retornam None ou []. Alterações em registros que
+    não existem levantam NaoEncontrado; qualquer falha do motor levanta
+    FalhaArmazenamento.
+    """
+
+    @abstractmethod
+    async def init_db(self):
+        """Prepara o armazenamento para uso"""
+
+    # ========== FICHAS ==========
+
+    @abstractmethod
+    async def criar_ficha(self, jogador_id, servidor_id, dados):
+        """Cria uma ficha e retorna o ID"""
+
+    @abstractmethod
+    async def buscar_fichas(self, jogador_id, servidor_id, ficha_id=None):
+        """Lista as fichas do jogador, mais recentes primeiro"""
+
+    @abstractmethod
+    async def atualizar_ficha(self, ficha_id, dados):
+        """Atualiza os campos editáveis de uma ficha"""
+
+    @abstractmethod
+    async def deletar_ficha(self, ficha_id, jogador_id, servidor_id):
+        """Deleta uma ficha (apenas se for do jogador)"""
+
+    # ========== SESSÕES ==========
+
+    @abstractmethod
+    async def criar_sessao(self, sessao_id, servidor_id, canal_id, mestre_id, sistema, nome_campanha=None):
+        """Registra uma nova sessão"""
+
+    @abstractmethod
+    async def get_sessao_ativa(self, canal_id):
+        """Busca a sessão ativa mais recente de um canal"""
+
+    @abstractmethod
+    async def encerrar_sessao(self, canal_id):
+        """Encerra as sessões ativas de um canal"""
+
+    # ========== COMBATE ==========
+
+    @abstractmethod
+    async def iniciar_combate(self, sessao_id, canal_id, participantes):
+        """Abre um combate no canal e retorna o ID"""
+
+    @abstractmethod
+    async def get_combate_ativo(self, canal_id):
+        """Busca o combate ativo mais recente de um canal"""
+
+    @abstractmethod
+    async def atualizar_combate(self, combate_id, dados):
+        """Atualiza turno, rodada e participantes de um combate"""
+
+    @abstractmethod
+    async def encerrar_combate(self, canal_id):
+        """Encerra os combates ativos de um canal"""
+
+
+class ArmazenamentoMemoria(Armazenamento):
+    """Mesma semântica do SQLite, mas tudo em dicionários (testes e benchmarks)"""
+
+    def __init__(self):
+        self._fichas = {}
+        self._sessoes = {}
+        self._combates = {}
+        self._proximo_id = {'fichas': 1, 'sessoes': 1, 'combate': 1}
+
+    def _novo_id(self, tabela):
+        novo = self._proximo_id[tabela]
+        self._proximo_id[tabela] += 1
+        return novo
+
+    async def init_db(self):
+        return True
+
+    # ========== FICHAS ==========
+
+    async def criar_ficha(self, jogador_id, servidor_id, dados):
+        agora = datetime.now().isoformat()
+        constituicao = dados.get('constituicao', 10)
+        nivel = dados.get('nivel', 1)
+        pv_max = dados.get('pv_max', 10 + (constituicao - 10) // 2 + (nivel - 1) * 6)
+
+        ficha_id = self._novo_id('fichas')
+        self._fichas[ficha_id] = {
+            'id': ficha_id,
+            'jogador_id': str(jogador_id),
+            'servidor_id': str(servidor_id),
+            'nome_personagem': dados.get('nome', 'Sem Nome'),
+            'classe': dados.get('classe', 'Aventureiro'),
+            'nivel': nivel,
+            'raca': dados.get('raca', 'Humano'),
+            'forca': dados.get('forca', 10),
+            'destreza': dados.get('destreza', 10),
+            'constituicao': constituicao,
+            'inteligencia': dados.get('inteligencia', 10),
+            'sabedoria': dados.get('sabedoria', 10),
+            'carisma': dados.get('carisma', 10),
+            'pv_max': pv_max,
+            'pv_atual': dados.get('pv_atual', pv_max),
+            'experiencia': 0,
+            'moedas': '{"po": 0, "pp": 0, "pe": 0, "pc": 0}',
+            'inventario': '[]',
+            'anotacoes': '',
+            'criado_em': agora,
+            'atualizado_em': agora,
+        }
+        return ficha_id
+
+    async def buscar_fichas(self, jogador_id, servidor_id, ficha_id=None):
+        fichas = [
+            f for f in self._fichas.values()
+            if f['jogador_id'] == str(jogador_id) and f['servidor_id'] == str(servidor_id)
+        ]
+        if ficha_id:
+            fichas = [f for f in fichas if f['id'] == ficha_id]
+        else:
+            fichas.sort(key=lambda f: f['atualizado_em'], reverse=True)
+        return [dict(f) for f in fichas]
+
+    async def atualizar_ficha(self, ficha_id, dados):
+        alteracoes = {k: v for k, v in dados.items() if k in CAMPOS_FICHA_EDITAVEIS}
+        if not alteracoes:
+            return False
+
+        ficha = self._fichas.get(ficha_id)
+        if ficha is None:
+            raise NaoEncontrado(f"Ficha {ficha_id} não existe")
+        ficha.update(alteracoes)
+        ficha['atualizado_em'] = datetime.now().isoformat()
+        return True
+
+    async def deletar_ficha(self, ficha_id, jogador_id, servidor_id):
+        ficha = self._fichas.get(ficha_id)
+        if not ficha or ficha['jogador_id'] != str(jogador_id) or ficha['servidor_id'] != str(servidor_id):
+            raise NaoEncontrado(f"Ficha {ficha_id} não existe para este jogador")
+        del self._fichas[ficha_id]
+        return True
+
+    # ========== SESSÕES ==========
+
+    async def criar_sessao(self, sessao_id, servidor_id, canal_id, mestre_id, sistema, nome_campanha=None):
+        if sessao_id in self._sessoes:
+            raise FalhaArmazenamento(f"Sessão {sessao_id} já existe")
+
+        agora = datetime.now().isoformat()
+        self._sessoes[sessao_id] = {
+            'id': self._novo_id('sessoes'),
+            'sessao_id': sessao_id,
+            'servidor_id': str(servidor_id),
+            'canal_id': str(canal_id),
+            'mestre_id': str(mestre_id),
+            'sistema': sistema,
+            'nome_campanha': nome_campanha or f"Sessão {agora[5:16]}",
+            'status': 'ativa',
+            'jogadores': '[]',
+            'historico': '[]',
+            'created_at': agora,
+            'updated_at': agora,
+        }
+        return True
+
+    async def get_sessao_ativa(self, canal_id):
+        ativas = [
+            s for s in self._sessoes.values()
+            if s['canal_id'] == str(canal_id) and s['status'] == 'ativa'
+        ]
+        if not ativas:
+            return None
+        return dict(max(ativas, key=lambda s: s['created_at']))
+
+    async def encerrar_sessao(self, canal_id):
+        agora = datetime.now().isoformat()
+        for sessao in self._sessoes.values():
+            if sessao['canal_id'] == str(canal_id) and sessao['status'] == 'ativa':
+                sessao['status'] = 'encerrada'
+                sessao['updated_at'] = agora
+        return True
+
+    # ========== COMBATE ==========
+
+    async def iniciar_combate(self, sessao_id, canal_id, participantes):
+        agora = datetime.now().isoformat()
+        participantes = copy.deepcopy(list(participantes))
+        combate_id = self._novo_id('combate')
+        self._combates[combate_id] = {
+            'id': combate_id,
+            'sessao_id': sessao_id,
+            'canal_id': str(canal_id),
+            'turno': 1,
+            'rodada': 1,
+            'participante_atual': participantes[0]['nome'] if participantes else None,
+            'participantes': participantes,
+            'ativo': 1,
+            'created_at': agora,
+            'updated_at': agora,
+        }
+        return combate_id
+
+    async def get_combate_ativo(self, canal_id):
+        ativos = [
+            c for c in self._combates.values()
+            if c['canal_id'] == str(canal_id) and c['ativo']
+        ]
+        if not ativos:
+            return None
+        return copy.deepcopy(max(ativos, key=lambda c: (c['created_at'], c['id'])))
+
+    async def atualizar_combate(self, combate_id, dados):
+        alteracoes = {k: v for k, v in dados.items() if k in CAMPOS_COMBATE_EDITAVEIS}
+        if not alteracoes:
+            return False
+
+        combate = self._combates.get(combate_id)
+        if combate is None:
+            raise NaoEncontrado(f"Combate {combate_id} não existe")
+        combate.update(copy.deepcopy(alteracoes))
+        combate['updated_at'] = datetime.now().isoformat()
+        return True
+
+    async def encerrar_combate(self, canal_id):
+        agora = datetime.now().isoformat()
+        for combate in self._combates.values():
+            if combate['canal_id'] == str(canal_id) and combate['ativo']:
+                combate['ativo'] = 0
+                combate['updated_at'] = agora
+        return True
@@ -0,0 +1,58 @@
+"""
+🛠️ Administração - Mestre RPG
+Recarga de extensões sem reiniciar o bot (somente o dono)
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+
+class Admin(commands.Cog):
+    """Comandos do dono do bot"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if await self.bot.is_owner(interaction.user):
+            return True
+        await interaction.response.send_message("🚫 Apenas o dono do bot pode usar este comando.", ephemeral=True)
+        return False
+
+    @app_commands.command(name="recarregar", description="Recarrega um módulo de comandos (somente o dono)")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.describe(modulo="Módulo a recarregar, ex: combate. Deixe vazio para todos")
+    async def recarregar(self, interaction: discord.Interaction, modulo: str = None):
+        await interaction.response.defer(ephemeral=True)
+
+        nomes = [f"cogs.{modulo}"] if modulo else list(self.bot.extensions)
+        try:
+            alterados, removidos = await self.bot.recarregar(nomes)
+        except commands.ExtensionError as e:
+            await interaction.followup.send(f"❌ Falha ao recarregar: {e}", ephemeral=True)
+            return
+
+        embed = discord.Embed(
+            title="🔄 Módulos Recarregados",
+            description=", ".join(f"`{n}`" for n in nomes),
+            color=discord.Color.teal()
+        )
+        embed.add_field(
+            name="Comandos sincronizados",
+            value=", ".join(f"/{n}" for n in alterados) or "Nenhum (sem alterações)",
+            inline=False
+        )
+        if removidos:
+            embed.add_field(name="Comandos removidos", value=", ".join(f"/{n}" for n in removidos), inline=False)
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @recarregar.autocomplete("modulo")
+    async def _modulos(self, interaction: discord.Interaction, atual: str):
+        nomes = [n.removeprefix("cogs.") for n in self.bot.extensions]
+        return [app_commands.Choice(name=n, value=n) for n in nomes if atual.lower() in n][:25]
+
+
+async def setup(bot):
+    await bot.add_cog(Admin(bot))
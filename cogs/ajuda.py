@@ -0,0 +1,44 @@
+"""
+📚 Ajuda - Mestre RPG
+Lista de comandos e tópicos de regras
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+
+class Ajuda(commands.Cog):
+    """Ajuda e regras"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="ajuda", description="Receba ajuda sobre regras")
+    async def ajuda(self, interaction: discord.Interaction, topico: str = None):
+        if topico is None:
+            embed = discord.Embed(
+                title="📚 Ajuda do Mestre RPG",
+                description="Comandos disponíveis:",
+                color=discord.Color.green()
+            )
+            embed.add_field(name="/rolar [dados]", value="Ex: /rolar 2d20+5", inline=False)
+            embed.add_field(name="/criar_sessão", value="Inicie uma nova aventura", inline=False)
+            embed.add_field(name="/ficha", value="Crie seu personagem", inline=False)
+            embed.add_field(name="/ajuda [tópico]", value="Ex: /ajuda combate", inline=False)
+            await interaction.response.send_message(embed=embed)
+        else:
+            # Dicionário de tópicos de ajuda
+            topicos = {
+                "combate": "⚔️ **Combate**: Ação, movimento, ataque. Role iniciativa com /rolar 1d20+destreza",
+                "magias": "🔮 **Magias**: Cada classe tem seu próprio livro de magias. Mago usa inteligência, Clérigo usa sabedoria.",
+                "dados": "🎲 **Dados**: Use /rolar XdY+Z. Ex: 1d20, 2d6+3, 1d8+2",
+                "classe": "📖 **Classes**: Guerreiro, Mago, Clérigo, Ladino, Bárbaro, etc.",
+                "d&d": "🐉 **D&D 5e**: Sistema principal. Força, Destreza, Constituição, Inteligência, Sabedoria, Carisma"
+            }
+            resposta = topicos.get(topico.lower(), f"📖 Tópico '{topico}' em desenvolvimento!")
+            await interaction.response.send_message(resposta)
+
+
+async def setup(bot):
+    await bot.add_cog(Ajuda(bot))
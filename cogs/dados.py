@@ -0,0 +1,80 @@
+"""
+🎲 Dados - Mestre RPG
+Rolagens livres e de iniciativa
+"""
+
+import random
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+
+class Dados(commands.Cog):
+    """Rolagens de dados"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="rolar", description="Role dados! Ex: /rolar 2d20+5")
+    async def rolar(self, interaction: discord.Interaction, dados: str):
+        try:
+            if '+' in dados:
+                parte_dado, modificador = dados.split('+')
+                modificador = int(modificador)
+            else:
+                parte_dado = dados
+                modificador = 0
+
+            quantidade, faces = parte_dado.split('d')
+            quantidade = int(quantidade)
+            faces = int(faces)
+
+            resultados = []
+            for _ in range(quantidade):
+                resultado = random.randint(1, faces)
+                resultados.append(resultado)
+
+            total = sum(resultados) + modificador
+
+            embed = discord.Embed(
+                title="🎲 Rolagem de Dados",
+                description=f"{interaction.user.mention} rolou **{dados}**",
+                color=discord.Color.blue()
+            )
+            embed.add_field(name="Resultados", value=str(resultados), inline=False)
+            embed.add_field(name="Modificador", value=f"+{modificador}" if modificador > 0 else "0", inline=True)
+            embed.add_field(name="Total", value=f"**{total}**", inline=True)
+            embed.set_footer(text="Que os dados sejam favoráveis!")
+
+            await interaction.response.send_message(embed=embed)
+
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Formato inválido! Use: 1d20, 2d6+3, etc.")
+
+    @app_commands.command(name="iniciativa", description="Role iniciativa para combate")
+    async def iniciativa(self, interaction: discord.Interaction, modificador: int = 0):
+        """Rola 1d20 + modificador para iniciativa"""
+        rolagem = random.randint(1, 20)
+        total = rolagem + modificador
+
+        embed = discord.Embed(
+            title="⚔️ Iniciativa!",
+            description=f"{interaction.user.mention} age com **{total}**",
+            color=discord.Color.orange()
+        )
+        embed.add_field(name="🎲 Rolagem", value=f"1d20: {rolagem}", inline=True)
+        embed.add_field(name="➕ Mod", value=modificador, inline=True)
+        embed.add_field(name="🏁 Total", value=f"**{total}**", inline=True)
+
+        # Mensagem dramática baseada no resultado
+        if total >= 20:
+            embed.set_footer(text="⚡ Você age antes que todos percebam o movimento!")
+        elif total <= 5:
+            embed.set_footer(text="😴 Você estava distraído... age por último.")
+
+        await interaction.response.send_message(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(Dados(bot))
@@ -0,0 +1,89 @@
+"""
+🏰 Sessão - Mestre RPG
+Campanhas e narração
+"""
+
+from datetime import datetime
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from execucao import adaptativo, enviar
+from narracao import narrador
+
+
+class Sessao(commands.Cog):
+    """Sessões de campanha e narração"""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="criar_sessão", description="Inicie uma nova campanha de RPG")
+    async def criar_sessao(self, interaction: discord.Interaction, sistema: str = "D&D 5e"):
+        sessao_id = f"{interaction.channel.id}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
+        self.bot.sessoes_ativas[sessao_id] = {
+            "mestre": interaction.user.id,
+            "canal": interaction.channel.id,
+            "sistema": sistema,
+            "jogadores": [],
+            "inicio": datetime.now().isoformat()
+        }
+
+        embed = discord.Embed(
+            title="🏰 Nova Sessão de RPG!",
+            description=f"Sistema: **{sistema}**",
+            color=discord.Color.gold()
+        )
+        embed.add_field(name="Mestre", value=interaction.user.mention, inline=True)
+        embed.add_field(name="Status", value="🟢 Preparado para aventura!", inline=True)
+        embed.add_field(name="ID Sessão", value=sessao_id[:8], inline=True)
+        embed.set_footer(text="Use /ficha para criar seu personagem!")
+
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="narrar", description="Peça para o mestre narrar uma ação")
+    @adaptativo(erro="❌ O mestre perdeu o fio da história. Tente novamente.")
+    async def narrar(self, interaction: discord.Interaction, acao: str, ficha_id: int = None):
+        dados_narracao = {"jogador": interaction.user.display_name}
+
+        # Sessão do canal: primeiro a da memória, depois a do banco
+        sessao = None
+        for dados_sessao in self.bot.sessoes_ativas.values():
+            if dados_sessao["canal"] == interaction.channel.id:
+                sessao = dados_sessao
+        if sessao is None:
+            sessao = await self.bot.db.get_sessao_ativa(interaction.channel.id)
+
+        sistema = sessao["sistema"] if sessao else None
+        if sessao and sessao.get("nome_campanha"):
+            dados_narracao["campanha"] = sessao["nome_campanha"]
+
+        # Personagem: a ficha pedida ou a mais recente do jogador
+        fichas = await self.bot.db.buscar_fichas(
+            str(interaction.user.id),
+            str(interaction.guild_id),
+            ficha_id
+        )
+        if fichas:
+            ficha = fichas[0]
+            dados_narracao["personagem"] = ficha['nome_personagem']
+            dados_narracao["classe"] = ficha['classe']
+            dados_narracao["raca"] = ficha['raca']
+
+        categoria, narracao = narrador.narrar(acao, sistema, **dados_narracao)
+
+        embed = discord.Embed(
+            title="🎭 Ação do Jogador",
+            description=f"*{acao}*",
+            color=discord.Color.orange()
+        )
+        embed.add_field(name="Narração", value=narracao, inline=False)
+        embed.set_footer(text=f"Mestre IA • {categoria.capitalize()} • Use /rolar para determinar o resultado")
+
+        await enviar(interaction, embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(Sessao(bot))
@@ -5,17 +5,31 @@ SQLite assíncrono para fichas, sessões e históricos
 
 import aiosqlite
 import json
+import logging
 import os
 from datetime import datetime
 
+from armazenamento import (
+    Armazenamento, FalhaArmazenamento, NaoEncontrado,
+    CAMPOS_FICHA_EDITAVEIS, CAMPOS_COMBATE_EDITAVEIS,
+)
+
+log = logging.getLogger(__name__)
+
 DB_PATH = "rpg_campanhas.db"
 
-class Database:
+class Database(Armazenamento):
     """Gerenciador do banco de dados"""
 
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+
     async def init_db(self):
         """Inicializa todas as tabelas"""
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with aiosqlite.connect(self.db_path) as db:
+            # Só tem efeito em bancos novos; os antigos são convertidos pela manutenção
+            await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
             # Tabela de fichas de personagem
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS fichas (
@@ -78,7 +92,7 @@ class Database:
             """)
 
             await db.commit()
-        print("✅ Banco de dados inicializado!")
+        log.info("✅ Banco de dados inicializado!")
         return True
 
     # ========== FICHAS ==========
@@ -86,7 +100,7 @@ class Database:
     async def criar_ficha(self, jogador_id, servidor_id, dados):
         """Cria uma nova ficha de personagem"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with aiosqlite.connect(self.db_path) as db:
                 agora = datetime.now().isoformat()
 
                 # Valores padrão
@@ -125,14 +139,13 @@ class Database:
                 cursor = await db.execute("SELECT last_insert_rowid()")
                 row = await cursor.fetchone()
                 return row[0]
-        except Exception as e:
-            print(f"❌ Erro ao criar ficha: {e}")
-            return None
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao criar ficha") from e
 
     async def buscar_fichas(self, jogador_id, servidor_id, ficha_id=None):
         """Busca fichas de um jogador"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with aiosqlite.connect(self.db_path) as db:
                 db.row_factory = aiosqlite.Row
 
                 if ficha_id:
@@ -149,23 +162,20 @@ class Database:
 
                 rows = await cursor.fetchall()
                 return [dict(row) for row in rows]
-        except Exception as e:
-            print(f"❌ Erro ao buscar fichas: {e}")
-            return []
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao buscar fichas") from e
 
     async def atualizar_ficha(self, ficha_id, dados):
         """Atualiza uma ficha existente"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with aiosqlite.connect(self.db_path) as db:
                 agora = datetime.now().isoformat()
 
                 # Construir query dinamicamente
                 sets = []
                 params = []
                 for key, value in dados.items():
-                    if key in ['nome_personagem', 'classe', 'nivel', 'raca',
-                              'forca', 'destreza', 'constituicao', 'inteligencia',
-                              'sabedoria', 'carisma', 'pv_max', 'pv_atual', 'experiencia']:
+                    if key in CAMPOS_FICHA_EDITAVEIS:
                         sets.append(f"{key} = ?")
                         params.append(value)
 
@@ -176,37 +186,39 @@ class Database:
                 params.append(agora)
                 params.append(ficha_id)
 
-                await db.execute(f"""
+                cursor = await db.execute(f"""
                     UPDATE fichas
                     SET {', '.join(sets)}
                     WHERE id = ?
                 """, params)
                 await db.commit()
+                if cursor.rowcount == 0:
+                    raise NaoEncontrado(f"Ficha {ficha_id} não existe")
                 return True
-        except Exception as e:
-            print(f"❌ Erro ao atualizar ficha: {e}")
-            return False
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao atualizar ficha") from e
 
     async def deletar_ficha(self, ficha_id, jogador_id, servidor_id):
         """Deleta uma ficha (apenas se for do jogador)"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
-                await db.execute("""
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute("""
                     DELETE FROM fichas
                     WHERE id = ? AND jogador_id = ? AND servidor_id = ?
                 """, (ficha_id, jogador_id, servidor_id))
                 await db.commit()
+                if cursor.rowcount == 0:
+                    raise NaoEncontrado(f"Ficha {ficha_id} não existe para este jogador")
                 return True
-        except Exception as e:
-            print(f"❌ Erro ao deletar ficha: {e}")
-            return False
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao deletar ficha") from e
 
     # ========== SESSÕES ==========
 
     async def criar_sessao(self, sessao_id, servidor_id, canal_id, mestre_id, sistema, nome_campanha=None):
         """Registra uma nova sessão"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with aiosqlite.connect(self.db_path) as db:
                 agora = datetime.now().isoformat()
                 nome = nome_campanha or f"Sessão {agora[5:16]}"
 
@@ -219,14 +231,13 @@ class Database:
                       sistema, nome, agora, agora))
                 await db.commit()
                 return True
-        except Exception as e:
-            print(f"❌ Erro ao criar sessão: {e}")
-            return False
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao criar sessão") from e
 
     async def get_sessao_ativa(self, canal_id):
         """Busca sessão ativa em um canal"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with aiosqlite.connect(self.db_path) as db:
                 db.row_factory = aiosqlite.Row
                 cursor = await db.execute("""
                     SELECT * FROM sessoes
@@ -235,14 +246,13 @@ class Database:
                 """, (str(canal_id),))
                 row = await cursor.fetchone()
                 return dict(row) if row else None
-        except Exception as e:
-            print(f"❌ Erro ao buscar sessão: {e}")
-            return None
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao buscar sessão") from e
 
     async def encerrar_sessao(self, canal_id):
         """Encerra uma sessão"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
+            async with aiosqlite.connect(self.db_path) as db:
                 await db.execute("""
                     UPDATE sessoes
                     SET status = 'encerrada', updated_at = ?
@@ -250,9 +260,91 @@ class Database:
                 """, (datetime.now().isoformat(), str(canal_id)))
                 await db.commit()
                 return True
-        except Exception as e:
-            print(f"❌ Erro ao encerrar sessão: {e}")
-            return False
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao encerrar sessão") from e
+
+    # ========== COMBATE ==========
+
+    async def iniciar_combate(self, sessao_id, canal_id, participantes):
+        """Abre um combate; participantes é uma lista de dicts com 'nome'"""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                agora = datetime.now().isoformat()
+                atual = participantes[0]['nome'] if participantes else None
+
+                cursor = await db.execute("""
+                    INSERT INTO combate (
+                        sessao_id, canal_id, participante_atual, participantes,
+                        created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, (sessao_id, canal_id, atual, json.dumps(participantes), agora, agora))
+                await db.commit()
+                return cursor.lastrowid
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao iniciar combate") from e
+
+    async def get_combate_ativo(self, canal_id):
+        """Busca combate ativo em um canal"""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                db.row_factory = aiosqlite.Row
+                cursor = await db.execute("""
+                    SELECT * FROM combate
+                    WHERE canal_id = ? AND ativo = 1
+                    ORDER BY created_at DESC, id DESC LIMIT 1
+                """, (str(canal_id),))
+                row = await cursor.fetchone()
+                if not row:
+                    return None
+                combate = dict(row)
+                combate['participantes'] = json.loads(combate['participantes'])
+                return combate
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao buscar combate") from e
+
+    async def atualizar_combate(self, combate_id, dados):
+        """Atualiza turno, rodada e participantes de um combate"""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                sets = []
+                params = []
+                for key, value in dados.items():
+                    if key in CAMPOS_COMBATE_EDITAVEIS:
+                        sets.append(f"{key} = ?")
+                        params.append(json.dumps(value) if key == 'participantes' else value)
+
+                if not sets:
+                    return False
+
+                sets.append("updated_at = ?")
+                params.append(datetime.now().isoformat())
+                params.append(combate_id)
+
+                cursor = await db.execute(f"""
+                    UPDATE combate
+                    SET {', '.join(sets)}
+                    WHERE id = ?
+                """, params)
+                await db.commit()
+                if cursor.rowcount == 0:
+                    raise NaoEncontrado(f"Combate {combate_id} não existe")
+                return True
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao atualizar combate") from e
+
+    async def encerrar_combate(self, canal_id):
+        """Encerra o combate de um canal"""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute("""
+                    UPDATE combate
+                    SET ativo = 0, updated_at = ?
+                    WHERE canal_id = ? AND ativo = 1
+                """, (datetime.now().isoformat(), str(canal_id)))
+                await db.commit()
+                return True
+        except aiosqlite.Error as e:
+            raise FalhaArmazenamento("Erro ao encerrar combate") from e
 
 # Instância global do banco
 db = Database()
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+⏱️ Execução de Comandos - Mestre RPG
+Responde na hora quando dá tempo e adia (defer) automaticamente quando não dá
+"""
+
+import asyncio
+import functools
+import logging
+import math
+import time
+
+import discord
+
+from armazenamento import FalhaArmazenamento, NaoEncontrado
+from registro import contexto
+
+log = logging.getLogger(__name__)
+
+# O Discord recusa a interação se a primeira resposta passar de 3 segundos
+PRAZO_RESPOSTA = 3.0
+
+# Folga para o defer chegar ao Discord antes do prazo
+MARGEM = 0.6
+
+# Peso de cada nova amostra na média móvel
+ALFA = 0.2
+
+# Código de erro do Discord para interação expirada
+INTERACAO_DESCONHECIDA = 10062
+
+
+class ExecutorComandos:
+    """Mede a latência de cada comando e decide entre responder ou adiar"""
+
+    def __init__(self, prazo=PRAZO_RESPOSTA, margem=MARGEM, alfa=ALFA):
+        self.prazo = prazo
+        self.margem = margem
+        self.alfa = alfa
+        self.estatisticas = {}
+        self._travas = {}
+
+    def _stats(self, comando):
+        return self.estatisticas.setdefault(comando, {
+            'execucoes': 0,
+            'media': 0.0,
+            'variancia': 0.0,
+            'adiados': 0,
+            'perdas': 0,
+        })
+
+    def estimativa(self, comando):
+        """Duração esperada (média + 2 desvios) do comando, em segundos"""
+        stats = self.estatisticas.get(comando)
+        if not stats or not stats['execucoes']:
+            return 0.0
+        return stats['media'] + 2 * math.sqrt(stats['variancia'])
+
+    def _registrar(self, comando, duracao):
+        stats = self._stats(comando)
+        if stats['execucoes'] == 0:
+            stats['media'] = duracao
+        else:
+            # Média e variância móveis exponenciais
+            diferenca = duracao - stats['media']
+            stats['media'] += self.alfa * diferenca
+            stats['variancia'] = (1 - self.alfa) * (stats['variancia'] + self.alfa * diferenca ** 2)
+        stats['execucoes'] += 1
+
+    def _perda(self, comando, interaction):
+        self._stats(comando)['perdas'] += 1
+        log.warning("⏰ Prazo de resposta perdido", extra=contexto(interaction, comando=comando))
+
+    def _idade(self, interaction, inicio):
+        """Tempo desde que o Discord criou a interação"""
+        pelo_discord = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        # Relógio local atrasado não pode esconder o tempo já gasto aqui
+        return max(pelo_discord, time.monotonic() - inicio)
+
+    async def executar(self, comando, func, interaction, *args, mensagem_erro=None, **kwargs):
+        """Roda o comando com defer antecipado ou vigiado
+
+        Erros do armazenamento têm resposta própria; os demais recebem
+        `mensagem_erro` ou, sem ela, seguem para o handler da árvore.
+        """
+        inicio = time.monotonic()
+        trava = asyncio.Lock()
+        self._travas[interaction.id] = (comando, trava)
+
+        if self.estimativa(comando) >= self.prazo - self.margem:
+            await self._adiar(comando, interaction)
+
+        vigia = asyncio.create_task(self._vigiar(comando, interaction, inicio))
+        try:
+            return await func(*args, **kwargs)
+        except NaoEncontrado:
+            await self.enviar(interaction, "❌ Registro não encontrado! Verifique o ID.")
+        except FalhaArmazenamento:
+            log.exception("Falha no armazenamento", extra=contexto(interaction, comando=comando))
+            await self.enviar(interaction, "❌ Erro no banco de dados. Tente novamente em instantes.")
+        except Exception:
+            if mensagem_erro is None:
+                raise
+            log.exception("❌ Erro no comando", extra=contexto(interaction, comando=comando))
+            await self.enviar(interaction, mensagem_erro)
+        finally:
+            vigia.cancel()
+            duracao = time.monotonic() - inicio
+            self._travas.pop(interaction.id, None)
+            self._registrar(comando, duracao)
+            log.info("Comando executado", extra=contexto(
+                interaction, comando=comando, duracao_ms=round(duracao * 1000, 1)
+            ))
+
+    async def _vigiar(self, comando, interaction, inicio):
+        restante = self.prazo - self.margem - self._idade(interaction, inicio)
+        await asyncio.sleep(max(0.0, restante))
+        # Depois de disparado, o defer não pode ser interrompido pelo fim do comando
+        await asyncio.shield(self._adiar(comando, interaction))
+
+    async def _adiar(self, comando, interaction):
+        _, trava = self._travas.get(interaction.id, (comando, asyncio.Lock()))
+        async with trava:
+            if interaction.response.is_done():
+                return
+            try:
+                await interaction.response.defer()
+                self._stats(comando)['adiados'] += 1
+            except discord.NotFound as e:
+                if e.code != INTERACAO_DESCONHECIDA:
+                    raise
+                self._perda(comando, interaction)
+
+    async def enviar(self, interaction, *args, **kwargs):
+        """Primeira resposta ou followup, conforme o comando já tenha sido adiado"""
+        nome_padrao = interaction.command.name if interaction.command else "?"
+        comando, trava = self._travas.get(interaction.id, (nome_padrao, asyncio.Lock()))
+        async with trava:
+            if interaction.response.is_done():
+                return await interaction.followup.send(*args, **kwargs)
+            try:
+                await interaction.response.send_message(*args, **kwargs)
+            except discord.NotFound as e:
+                if e.code != INTERACAO_DESCONHECIDA:
+                    raise
+                self._perda(comando, interaction)
+
+
+def _achar_interacao(args):
+    for arg in args:
+        if isinstance(arg, discord.Interaction):
+            return arg
+    raise TypeError("comando adaptativo sem discord.Interaction nos argumentos")
+
+
+def adaptativo(func=None, *, erro=None):
+    """Decorador para comandos que acessam o banco antes de responder
+
+    Usa o ExecutorComandos guardado em `bot.executor`. Dentro do comando,
+    responda sempre com `enviar(interaction, ...)`. Com `erro=`, falhas
+    inesperadas são registradas e respondidas com essa mensagem.
+    """
+    if func is None:
+        return functools.partial(adaptativo, erro=erro)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        interaction = _achar_interacao(args)
+        executor = interaction.client.executor
+        comando = interaction.command.name if interaction.command else func.__name__
+        return await executor.executar(comando, func, interaction, *args, mensagem_erro=erro, **kwargs)
+
+    return wrapper
+
+
+async def enviar(interaction, *args, **kwargs):
+    """Atalho para ExecutorComandos.enviar"""
+    return await interaction.client.executor.enviar(interaction, *args, **kwargs)
@@ -0,0 +1,302 @@
+"""
+🧹 Manutenção em Segundo Plano - Mestre RPG
+Arquiva sessões antigas, compacta o banco e faz backups online
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from datetime import datetime, timedelta
+
+import aiosqlite
+import discord
+from discord.ext import tasks
+
+from database import DB_PATH
+
+log = logging.getLogger(__name__)
+
+ARQUIVO_PATH = "rpg_arquivo.db"
+PASTA_BACKUPS = "backups"
+
+# Sessões encerradas há mais tempo que isto vão para o arquivo
+RETENCAO_DIAS = int(os.getenv("MANUTENCAO_RETENCAO_DIAS", "30"))
+
+# Janela de baixo movimento (horas locais), ex: "3-6" = das 3h às 6h
+HORARIO_OCIOSO = os.getenv("MANUTENCAO_HORARIO", "3-6")
+
+# Canal opcional para receber os relatórios
+CANAL_RELATORIO = os.getenv("MANUTENCAO_CANAL_ID")
+
+BACKUPS_MANTIDOS = 7
+PAGINAS_POR_PASSO = 64
+PAUSA_ENTRE_PASSOS = 0.05
+
+# incremental_vacuum em blocos curtos para não segurar o lock de escrita
+PAGINAS_VACUUM_POR_PASSO = 256
+PASSOS_VACUUM_POR_CICLO = 40
+
+# PRAGMA auto_vacuum: 2 = INCREMENTAL
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def _janela_ociosa(texto):
+    inicio, fim = (int(h) for h in texto.split("-"))
+    return inicio, fim
+
+
+class Manutencao:
+    """Agenda e executa as tarefas de manutenção sem bloquear os comandos"""
+
+    def __init__(self, bot, db_path=DB_PATH, arquivo_path=ARQUIVO_PATH,
+                 pasta_backups=PASTA_BACKUPS, retencao_dias=RETENCAO_DIAS):
+        self.bot = bot
+        self.db_path = db_path
+        self.arquivo_path = arquivo_path
+        self.pasta_backups = pasta_backups
+        self.retencao = timedelta(days=retencao_dias)
+        self.janela = _janela_ociosa(HORARIO_OCIOSO)
+        self.relatorios = deque(maxlen=20)
+        self._ultima_otimizacao = None
+        self._ultimo_backup = None
+
+    def iniciar(self):
+        if not self.ciclo.is_running():
+            self.ciclo.start()
+
+    def parar(self):
+        self.ciclo.cancel()
+
+    def em_horario_ocioso(self, agora=None):
+        """Verifica se estamos na janela de baixo movimento"""
+        hora = (agora or datetime.now()).hour
+        inicio, fim = self.janela
+        if inicio <= fim:
+            return inicio <= hora < fim
+        # Janela que atravessa a meia-noite, ex: "23-2"
+        return hora >= inicio or hora < fim
+
+    @tasks.loop(minutes=30)
+    async def ciclo(self):
+        agora = datetime.now()
+        relatorio = {"inicio": agora.isoformat(timespec="seconds")}
+
+        # Arquivamento é barato e roda em todo ciclo
+        try:
+            relatorio["arquivadas"] = await self.arquivar_sessoes()
+        except Exception as e:
+            log.exception("❌ Erro ao arquivar sessões")
+            relatorio["erro_arquivo"] = str(e)
+
+        # O resto só uma vez por dia, fora do horário de pico
+        if self.em_horario_ocioso(agora):
+            hoje = agora.date()
+            if self._ultima_otimizacao != hoje:
+                try:
+                    relatorio["paginas_liberadas"] = await self.otimizar()
+                    self._ultima_otimizacao = hoje
+                except Exception as e:
+                    log.exception("❌ Erro ao otimizar o banco")
+                    relatorio["erro_otimizacao"] = str(e)
+            if self._ultimo_backup != hoje:
+                try:
+                    relatorio["backup"] = await self.fazer_backup()
+                    self._ultimo_backup = hoje
+                except Exception as e:
+                    log.exception("❌ Erro ao fazer backup")
+                    relatorio["erro_backup"] = str(e)
+
+        relatorio["duracao"] = round((datetime.now() - agora).total_seconds(), 2)
+        await self.relatar(relatorio)
+
+    @ciclo.before_loop
+    async def _antes_do_ciclo(self):
+        await self.bot.wait_until_ready()
+
+    # ========== TAREFAS ==========
+
+    async def arquivar_sessoes(self):
+        """Move sessões encerradas além da retenção para o banco de arquivo"""
+        limite = (datetime.now() - self.retencao).isoformat()
+        agora = datetime.now().isoformat()
+        condicao = "status = 'encerrada' AND updated_at < ?"
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("ATTACH DATABASE ? AS arquivo", (self.arquivo_path,))
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS arquivo.sessoes (
+                    id INTEGER PRIMARY KEY,
+                    sessao_id TEXT UNIQUE NOT NULL,
+                    servidor_id TEXT NOT NULL,
+                    canal_id TEXT NOT NULL,
+                    mestre_id TEXT NOT NULL,
+                    sistema TEXT NOT NULL,
+                    nome_campanha TEXT,
+                    status TEXT,
+                    jogadores TEXT,
+                    historico TEXT,
+                    created_at TEXT,
+                    updated_at TEXT,
+                    arquivado_em TEXT
+                )
+            """)
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS arquivo.combate (
+                    id INTEGER PRIMARY KEY,
+                    sessao_id TEXT NOT NULL,
+                    canal_id TEXT NOT NULL,
+                    turno INTEGER,
+                    rodada INTEGER,
+                    participante_atual TEXT,
+                    participantes TEXT,
+                    ativo BOOLEAN,
+                    created_at TEXT,
+                    updated_at TEXT
+                )
+            """)
+            await db.commit()
+
+            # Tudo numa transação só: ou a sessão está no arquivo, ou continua no principal
+            await db.execute(f"""
+                INSERT OR REPLACE INTO arquivo.sessoes
+                SELECT *, ? FROM main.sessoes WHERE {condicao}
+            """, (agora, limite))
+            await db.execute(f"""
+                INSERT OR REPLACE INTO arquivo.combate
+                SELECT * FROM main.combate WHERE sessao_id IN (
+                    SELECT sessao_id FROM main.sessoes WHERE {condicao}
+                )
+            """, (limite,))
+            await db.execute(f"""
+                DELETE FROM main.combate WHERE sessao_id IN (
+                    SELECT sessao_id FROM main.sessoes WHERE {condicao}
+                )
+            """, (limite,))
+            cursor = await db.execute(f"DELETE FROM main.sessoes WHERE {condicao}", (limite,))
+            arquivadas = cursor.rowcount
+            await db.commit()
+
+            await db.execute("DETACH DATABASE arquivo")
+            return arquivadas
+
+    async def otimizar(self):
+        """Roda incremental_vacuum em blocos e optimize; retorna as páginas liberadas"""
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute("PRAGMA auto_vacuum")
+            (modo,) = await cursor.fetchone()
+            cursor = await db.execute("PRAGMA freelist_count")
+            (livres_antes,) = await cursor.fetchone()
+
+            if modo != AUTO_VACUUM_INCREMENTAL:
+                # Converter exige um VACUUM completo, que trava o banco: só offline
+                log.warning(
+                    "Banco %s sem auto_vacuum incremental; rode 'python manutencao.py --converter' "
+                    "com o bot parado para habilitar",
+                    self.db_path,
+                )
+            else:
+                livres = livres_antes
+                for _ in range(PASSOS_VACUUM_POR_CICLO):
+                    if not livres:
+                        break
+                    # executescript roda o pragma até o fim; execute pararia na 1ª página
+                    await db.executescript(f"PRAGMA incremental_vacuum({PAGINAS_VACUUM_POR_PASSO});")
+                    cursor = await db.execute("PRAGMA freelist_count")
+                    (livres,) = await cursor.fetchone()
+                    # Deixa os comandos pegarem o lock entre um bloco e outro
+                    await asyncio.sleep(PAUSA_ENTRE_PASSOS)
+
+            await db.execute("PRAGMA optimize")
+
+            cursor = await db.execute("PRAGMA freelist_count")
+            (livres_depois,) = await cursor.fetchone()
+            return max(0, livres_antes - livres_depois)
+
+    async def fazer_backup(self):
+        """Backup online em pequenos passos de páginas; retorna o caminho"""
+        os.makedirs(self.pasta_backups, exist_ok=True)
+        nome = f"rpg_campanhas_{datetime.now().strftime('%Y%m%d%H%M%S')}.db"
+        destino = os.path.join(self.pasta_backups, nome)
+        temporario = destino + ".parcial"
+
+        try:
+            async with aiosqlite.connect(self.db_path) as origem:
+                async with aiosqlite.connect(temporario) as copia:
+                    await origem.backup(copia, pages=PAGINAS_POR_PASSO, sleep=PAUSA_ENTRE_PASSOS)
+            os.replace(temporario, destino)
+        finally:
+            # Cópia interrompida não fica para trás ocupando espaço
+            if os.path.exists(temporario):
+                os.remove(temporario)
+
+        # Mantém apenas os backups mais recentes
+        antigos = sorted(
+            f for f in os.listdir(self.pasta_backups)
+            if f.startswith("rpg_campanhas_") and f.endswith(".db")
+        )[:-BACKUPS_MANTIDOS]
+        for arquivo in antigos:
+            os.remove(os.path.join(self.pasta_backups, arquivo))
+
+        return destino
+
+    # ========== RELATÓRIO ==========
+
+    async def relatar(self, relatorio):
+        """Guarda o relatório, imprime o resumo e avisa no canal configurado"""
+        self.relatorios.append(relatorio)
+
+        partes = [f"{relatorio.get('arquivadas', 0)} sessões arquivadas"]
+        if "paginas_liberadas" in relatorio:
+            partes.append(f"{relatorio['paginas_liberadas']} páginas liberadas")
+        if "backup" in relatorio:
+            partes.append(f"backup em {relatorio['backup']}")
+        erros = [v for k, v in relatorio.items() if k.startswith("erro_")]
+        resumo = ", ".join(partes)
+
+        # Argumentos %-style: o limite de repetição agrupa pela mensagem sem os valores
+        duracao = {"duracao_ms": relatorio["duracao"] * 1000}
+        if erros:
+            log.error("❌ Manutenção com erros (%s): %s", resumo, "; ".join(erros), extra=duracao)
+        else:
+            log.info("🧹 Manutenção concluída: %s", resumo, extra=duracao)
+
+        # Ciclos sem nada a fazer não precisam de aviso no canal
+        if not CANAL_RELATORIO or (len(partes) == 1 and not relatorio.get("arquivadas") and not erros):
+            return
+
+        canal = self.bot.get_channel(int(CANAL_RELATORIO))
+        if canal is None:
+            return
+
+        embed = discord.Embed(
+            title="🧹 Manutenção do Banco",
+            description=resumo,
+            color=discord.Color.red() if erros else discord.Color.dark_teal()
+        )
+        for erro in erros:
+            embed.add_field(name="❌ Erro", value=erro[:1024], inline=False)
+        try:
+            await canal.send(embed=embed)
+        except discord.HTTPException:
+            log.exception("❌ Erro ao enviar relatório de manutenção")
+
+
+async def converter_auto_vacuum(db_path=DB_PATH):
+    """Conversão única para auto_vacuum incremental (VACUUM completo, bot parado)"""
+    async with aiosqlite.connect(db_path) as db:
+        await db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        await db.execute("VACUUM")
+        cursor = await db.execute("PRAGMA auto_vacuum")
+        (modo,) = await cursor.fetchone()
+        return modo == AUTO_VACUUM_INCREMENTAL
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--converter" in sys.argv:
+        ok = asyncio.run(converter_auto_vacuum())
+        print("✅ auto_vacuum incremental habilitado!" if ok else "❌ Não foi possível converter o banco")
+    else:
+        print("Uso: python manutencao.py --converter  (com o bot parado)")
@@ -0,0 +1,171 @@
+"""
+🎭 Motor de Narração - Mestre RPG
+Classifica a ação do jogador por palavras-chave e preenche modelos temáticos
+"""
+
+import json
+import os
+import random
+import re
+import unicodedata
+
+PASTA_NARRATIVAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "narrativas")
+
+# Corpus usado quando o sistema da sessão não tem arquivo próprio
+CORPUS_PADRAO = "generico"
+
+# Apelidos aceitos para cada corpus (já normalizados)
+APELIDOS_SISTEMA = {
+    "dnd5e": "dnd5e",
+    "dnd": "dnd5e",
+    "d&d5e": "dnd5e",
+    "d&d": "dnd5e",
+    "dungeonsanddragons": "dnd5e",
+}
+
+CATEGORIAS = ("combate", "furtividade", "magia", "social", "exploracao")
+
+
+def normalizar(texto):
+    """Remove acentos e coloca em minúsculas"""
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+def chave_sistema(sistema):
+    """Converte o nome do sistema (ex: 'D&D 5e') na chave do corpus"""
+    if not sistema:
+        return CORPUS_PADRAO
+    # Só letras, dígitos e '&': o nome vem do usuário e vira nome de arquivo
+    chave = re.sub(r"[^a-z0-9&]", "", normalizar(sistema))
+    return APELIDOS_SISTEMA.get(chave, chave) or CORPUS_PADRAO
+
+
+class _Contexto(dict):
+    """Dicionário para format_map que mantém campos desconhecidos intactos"""
+
+    def __missing__(self, chave):
+        return "{" + chave + "}"
+
+
+class Corpus:
+    """Modelos e índice de palavras-chave de um sistema
+
+    Cada palavra-chave é um radical casado no início de palavra ('atac'
+    cobre 'ataco', 'atacar'...). Com '=' na frente ('=soco') só vale a
+    palavra inteira. Cada ocorrência pontua pelo seu tamanho, então
+    expressões longas ('bola de fogo') pesam mais que radicais curtos.
+    """
+
+    def __init__(self, nome, palavras_chave, modelos):
+        self.nome = nome
+        self.palavras_chave = palavras_chave
+        self.modelos = modelos
+        self._categoria_por_radical = {}
+
+        padroes = []
+        for categoria, lista in palavras_chave.items():
+            for radical in lista:
+                radical = normalizar(radical)
+                inteira = radical.startswith("=")
+                radical = radical.lstrip("=")
+                self._categoria_por_radical.setdefault(radical, categoria)
+                padroes.append((radical, re.escape(radical) + (r"\b" if inteira else "")))
+
+        # Radicais mais longos primeiro para que 'ataque furtivo' vença 'atac'
+        padroes.sort(key=lambda p: len(p[0]), reverse=True)
+
+        # Uma única expressão compilada: cada ocorrência é um radical no início de palavra
+        alternativas = "|".join(padrao for _, padrao in padroes)
+        self._indice = re.compile(rf"\b(?:{alternativas})") if padroes else None
+
+    def classificar(self, acao):
+        """Retorna a categoria de maior pontuação no texto (ou None)"""
+        if self._indice is None:
+            return None
+
+        pontos = {}
+        for ocorrencia in self._indice.finditer(normalizar(acao)):
+            trecho = ocorrencia.group(0)
+            categoria = self._categoria_por_radical[trecho]
+            pontos[categoria] = pontos.get(categoria, 0) + len(trecho)
+
+        if not pontos:
+            return None
+        # Empate: vale a ordem de CATEGORIAS
+        return max(CATEGORIAS, key=lambda c: pontos.get(c, 0))
+
+    def narrar(self, acao, contexto, rng=random):
+        """Escolhe e preenche um modelo para a ação"""
+        categoria = self.classificar(acao) or "neutro"
+        opcoes = self.modelos.get(categoria) or self.modelos["neutro"]
+        modelo = rng.choice(opcoes)
+        return categoria, modelo.format_map(_Contexto(contexto))
+
+
+class Narrador:
+    """Carrega corpora sob demanda, um por sistema"""
+
+    def __init__(self, pasta=PASTA_NARRATIVAS):
+        self.pasta = pasta
+        self._corpora = {}
+        self._disponiveis = None
+
+    def disponiveis(self):
+        """Chaves dos corpora existentes na pasta (lista lida uma vez)"""
+        if self._disponiveis is None:
+            self._disponiveis = frozenset(
+                nome[:-len(".json")] for nome in os.listdir(self.pasta) if nome.endswith(".json")
+            )
+        return self._disponiveis
+
+    def _ler(self, chave):
+        caminho = os.path.join(self.pasta, f"{chave}.json")
+        with open(caminho, encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+
+    def corpus(self, sistema):
+        """Retorna o corpus do sistema, carregando o arquivo na primeira vez"""
+        chave = chave_sistema(sistema)
+        if chave not in self.disponiveis():
+            # Sistemas sem corpus próprio usam o padrão, sem criar entrada no cache
+            chave = CORPUS_PADRAO
+        if chave in self._corpora:
+            return self._corpora[chave]
+
+        base = self._corpora.get(CORPUS_PADRAO) or self._carregar_padrao()
+        if chave == CORPUS_PADRAO:
+            return base
+
+        dados = self._ler(chave)
+
+        # O corpus do sistema estende as palavras-chave e substitui os modelos do padrão
+        palavras = {c: list(l) for c, l in base.palavras_chave.items()}
+        for categoria, lista in dados.get("palavras_chave", {}).items():
+            palavras.setdefault(categoria, []).extend(lista)
+        modelos = dict(base.modelos)
+        modelos.update(dados.get("modelos", {}))
+
+        corpus = Corpus(chave, palavras, modelos)
+        self._corpora[chave] = corpus
+        return corpus
+
+    def _carregar_padrao(self):
+        dados = self._ler(CORPUS_PADRAO)
+        corpus = Corpus(CORPUS_PADRAO, dados["palavras_chave"], dados["modelos"])
+        self._corpora[CORPUS_PADRAO] = corpus
+        return corpus
+
+    def narrar(self, acao, sistema=None, **contexto):
+        """Classifica a ação e devolve (categoria, texto narrado)"""
+        contexto.setdefault("acao", acao)
+        contexto.setdefault("sistema", sistema or "RPG")
+        contexto.setdefault("personagem", contexto.get("jogador") or "O aventureiro")
+        contexto.setdefault("classe", "aventureiro")
+        contexto.setdefault("raca", "viajante")
+        contexto.setdefault("campanha", "esta aventura")
+        return self.corpus(sistema).narrar(acao, contexto)
+
+
+# Instância global do narrador
+narrador = Narrador()
@@ -0,0 +1,189 @@
+"""
+📜 Registro de Eventos - Mestre RPG
+Logs estruturados em JSON, escritos por uma thread fora do event loop
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime, timezone
+
+# Campos de contexto aceitos em `extra=` e copiados para o JSON
+CAMPOS_CONTEXTO = ("comando", "guild", "usuario", "canal", "duracao_ms")
+
+# Quantas repetições do mesmo erro passam por janela antes de começar a suprimir
+REPETICOES_POR_JANELA = 5
+JANELA_REPETICAO = 60.0
+
+_listener = None
+_limite = None
+_fila = None
+_parar = None
+_descarregador = None
+
+
+def contexto(interaction, **extra):
+    """Campos de contexto de uma interação para usar em `extra=`"""
+    campos = {
+        "comando": interaction.command.name if interaction.command else None,
+        "guild": interaction.guild_id,
+        "usuario": interaction.user.id if interaction.user else None,
+        "canal": interaction.channel_id,
+    }
+    campos.update(extra)
+    return campos
+
+
+class FormatoJSON(logging.Formatter):
+    """Uma linha JSON por registro"""
+
+    def format(self, record):
+        dados = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for campo in CAMPOS_CONTEXTO:
+            valor = getattr(record, campo, None)
+            if valor is not None:
+                dados[campo] = valor
+        if getattr(record, "erro", None):
+            dados["erro"] = record.erro
+        if getattr(record, "suprimidos", 0):
+            dados["suprimidos"] = record.suprimidos
+        return json.dumps(dados, ensure_ascii=False, default=str)
+
+
+class LimiteRepeticao(logging.Filter):
+    """Deixa passar poucas cópias do mesmo erro por janela e conta o resto"""
+
+    def __init__(self, limite=REPETICOES_POR_JANELA, janela=JANELA_REPETICAO):
+        super().__init__()
+        self.limite = limite
+        self.janela = janela
+        self._contagem = {}
+        self._trava = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING:
+            return True
+
+        tipo = record.exc_info[0].__name__ if record.exc_info and record.exc_info[0] else None
+        chave = (record.name, record.msg, tipo)
+        agora = time.monotonic()
+
+        with self._trava:
+            inicio, vistos, suprimidos = self._contagem.get(chave, (agora, 0, 0))
+            if agora - inicio >= self.janela:
+                # Nova janela: o primeiro registro leva o total suprimido na anterior
+                record.suprimidos = suprimidos
+                inicio, vistos, suprimidos = agora, 0, 0
+
+            if vistos < self.limite:
+                self._contagem[chave] = (inicio, vistos + 1, suprimidos)
+                return True
+
+            self._contagem[chave] = (inicio, vistos, suprimidos + 1)
+            return False
+
+    def descarregar(self, tudo=False):
+        """Retira as janelas vencidas (ou todas) e devolve [(logger, msg, tipo, suprimidos)]"""
+        agora = time.monotonic()
+        resultado = []
+        with self._trava:
+            for chave, (inicio, _, suprimidos) in list(self._contagem.items()):
+                if tudo or agora - inicio >= self.janela:
+                    del self._contagem[chave]
+                    if suprimidos:
+                        resultado.append((*chave, suprimidos))
+        return resultado
+
+
+class FilaRegistro(logging.handlers.QueueHandler):
+    """Só enfileira; formatação e escrita ficam com a thread do listener"""
+
+    def prepare(self, record):
+        # Tipo, mensagem e pilha precisam ser capturados aqui, enquanto o traceback existe
+        record = logging.makeLogRecord(record.__dict__)
+        if record.exc_info:
+            tipo, erro, tb = record.exc_info
+            record.erro = {
+                "tipo": tipo.__name__,
+                "mensagem": str(erro),
+                "pilha": "".join(traceback.format_exception(tipo, erro, tb)),
+            }
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+
+def _relatar_suprimidos(tudo=False):
+    """Enfileira um aviso por erro que teve cópias suprimidas"""
+    for nome, msg, tipo, suprimidos in _limite.descarregar(tudo):
+        resumo = logging.makeLogRecord({
+            "name": nome,
+            "levelno": logging.WARNING,
+            "levelname": "WARNING",
+            "msg": f"🔁 Repetições suprimidas: {msg}",
+            "suprimidos": suprimidos,
+        })
+        if tipo:
+            resumo.erro = {"tipo": tipo}
+        # Direto na fila: o aviso não passa de novo pelo filtro
+        _fila.put_nowait(resumo)
+
+
+def _descarregar_periodicamente(parar, intervalo):
+    while not parar.wait(intervalo):
+        _relatar_suprimidos()
+
+
+def configurar(nivel=logging.INFO, saida=None):
+    """Liga o pipeline: QueueHandler no root logger, listener em segundo plano"""
+    global _listener, _limite, _fila, _parar, _descarregador
+    if _listener is not None:
+        return _listener
+
+    _fila = fila = queue.SimpleQueue()
+    _limite = LimiteRepeticao()
+    handler_fila = FilaRegistro(fila)
+    handler_fila.addFilter(_limite)
+
+    handler_saida = logging.StreamHandler(saida or sys.stdout)
+    handler_saida.setFormatter(FormatoJSON())
+
+    raiz = logging.getLogger()
+    raiz.handlers = [handler_fila]
+    raiz.setLevel(nivel)
+
+    _listener = logging.handlers.QueueListener(fila, handler_saida, respect_handler_level=True)
+    _listener.start()
+
+    # Sem isto, a contagem de um erro que parou de repetir nunca seria reportada
+    _parar = threading.Event()
+    _descarregador = threading.Thread(
+        target=_descarregar_periodicamente, args=(_parar, _limite.janela),
+        name="registro-suprimidos", daemon=True,
+    )
+    _descarregador.start()
+    return _listener
+
+
+def encerrar():
+    """Reporta o que foi suprimido, esvazia a fila e para as threads"""
+    global _listener, _limite, _fila, _parar, _descarregador
+    if _listener is None:
+        return
+    _parar.set()
+    _descarregador.join()
+    _relatar_suprimidos(tudo=True)
+    _listener.stop()
+    _listener = _limite = _fila = _parar = _descarregador = None
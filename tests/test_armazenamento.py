@@ -0,0 +1,191 @@
+"""Conformidade: SQLite e memória precisam se comportar igual"""
+
+import asyncio
+import time
+
+import pytest
+
+from armazenamento import ArmazenamentoMemoria, FalhaArmazenamento, NaoEncontrado
+from database import Database
+
+
+@pytest.fixture(params=["sqlite", "memoria"])
+def armazenamento(request, tmp_path):
+    if request.param == "sqlite":
+        motor = Database(str(tmp_path / "x.db"))
+    else:
+        motor = ArmazenamentoMemoria()
+    asyncio.run(motor.init_db())
+    return motor
+
+
+def rodar(coro):
+    return asyncio.run(coro)
+
+
+# ========== FICHAS ==========
+
+def test_criar_ficha_valores_padrao(armazenamento):
+    ficha_id = rodar(armazenamento.criar_ficha("1", "9", {}))
+    (ficha,) = rodar(armazenamento.buscar_fichas("1", "9", ficha_id))
+
+    assert ficha["id"] == ficha_id
+    assert ficha["nome_personagem"] == "Sem Nome"
+    assert ficha["classe"] == "Aventureiro"
+    assert ficha["raca"] == "Humano"
+    assert ficha["nivel"] == 1
+    assert ficha["forca"] == ficha["carisma"] == 10
+    assert ficha["pv_max"] == ficha["pv_atual"] == 10
+    assert ficha["experiencia"] == 0
+    assert ficha["inventario"] == "[]"
+    assert ficha["criado_em"] == ficha["atualizado_em"]
+
+
+def test_criar_ficha_deriva_pv_max(armazenamento):
+    ficha_id = rodar(armazenamento.criar_ficha("1", "9", {"nome": "Thorin", "constituicao": 14, "nivel": 3}))
+    (ficha,) = rodar(armazenamento.buscar_fichas("1", "9", ficha_id))
+
+    # 10 + mod CON (+2) + 2 níveis extras * 6
+    assert ficha["pv_max"] == 24
+    assert ficha["pv_atual"] == 24
+
+
+def test_criar_ficha_respeita_pv_informado(armazenamento):
+    ficha_id = rodar(armazenamento.criar_ficha("1", "9", {"pv_max": 30, "pv_atual": 12}))
+    (ficha,) = rodar(armazenamento.buscar_fichas("1", "9", ficha_id))
+    assert (ficha["pv_max"], ficha["pv_atual"]) == (30, 12)
+
+
+def test_buscar_fichas_mais_recentes_primeiro(armazenamento):
+    primeira = rodar(armazenamento.criar_ficha("1", "9", {"nome": "A"}))
+    time.sleep(0.01)
+    rodar(armazenamento.criar_ficha("1", "9", {"nome": "B"}))
+    assert [f["nome_personagem"] for f in rodar(armazenamento.buscar_fichas("1", "9"))] == ["B", "A"]
+
+    time.sleep(0.01)
+    rodar(armazenamento.atualizar_ficha(primeira, {"pv_atual": 3}))
+    assert [f["nome_personagem"] for f in rodar(armazenamento.buscar_fichas("1", "9"))] == ["A", "B"]
+
+
+def test_buscar_fichas_filtra_por_id_jogador_e_servidor(armazenamento):
+    minha = rodar(armazenamento.criar_ficha("1", "9", {"nome": "Minha"}))
+    outra = rodar(armazenamento.criar_ficha("2", "9", {"nome": "Outra"}))
+    rodar(armazenamento.criar_ficha("1", "8", {"nome": "Outro servidor"}))
+
+    assert [f["id"] for f in rodar(armazenamento.buscar_fichas("1", "9", minha))] == [minha]
+    assert rodar(armazenamento.buscar_fichas("1", "9", outra)) == []
+    assert rodar(armazenamento.buscar_fichas("1", "9", 999)) == []
+    assert len(rodar(armazenamento.buscar_fichas("1", "9"))) == 1
+
+
+def test_atualizar_ficha(armazenamento):
+    ficha_id = rodar(armazenamento.criar_ficha("1", "9", {}))
+
+    assert rodar(armazenamento.atualizar_ficha(ficha_id, {"pv_atual": 4, "moedas": "ignorado"}))
+    assert rodar(armazenamento.atualizar_ficha(ficha_id, {"moedas": "ignorado"})) is False
+
+    (ficha,) = rodar(armazenamento.buscar_fichas("1", "9", ficha_id))
+    assert ficha["pv_atual"] == 4
+    assert ficha["moedas"] != "ignorado"
+
+
+def test_atualizar_ficha_inexistente(armazenamento):
+    with pytest.raises(NaoEncontrado):
+        rodar(armazenamento.atualizar_ficha(999, {"pv_atual": 1}))
+
+
+def test_deletar_ficha(armazenamento):
+    ficha_id = rodar(armazenamento.criar_ficha("1", "9", {}))
+
+    # Só o dono, no mesmo servidor, pode apagar
+    with pytest.raises(NaoEncontrado):
+        rodar(armazenamento.deletar_ficha(ficha_id, "2", "9"))
+    with pytest.raises(NaoEncontrado):
+        rodar(armazenamento.deletar_ficha(ficha_id, "1", "8"))
+
+    assert rodar(armazenamento.deletar_ficha(ficha_id, "1", "9"))
+    assert rodar(armazenamento.buscar_fichas("1", "9")) == []
+
+    with pytest.raises(NaoEncontrado):
+        rodar(armazenamento.deletar_ficha(ficha_id, "1", "9"))
+
+
+# ========== SESSÕES ==========
+
+def test_sessao_ativa_e_encerramento(armazenamento):
+    assert rodar(armazenamento.get_sessao_ativa(123)) is None
+    assert rodar(armazenamento.criar_sessao("s1", 9, 123, 1, "D&D 5e", "Mina Perdida"))
+
+    sessao = rodar(armazenamento.get_sessao_ativa(123))
+    assert sessao["sessao_id"] == "s1"
+    assert sessao["canal_id"] == "123"
+    assert sessao["sistema"] == "D&D 5e"
+    assert sessao["nome_campanha"] == "Mina Perdida"
+    assert sessao["status"] == "ativa"
+
+    # Canal aceita int ou str
+    assert rodar(armazenamento.get_sessao_ativa("123"))["sessao_id"] == "s1"
+
+    assert rodar(armazenamento.encerrar_sessao(123))
+    assert rodar(armazenamento.get_sessao_ativa(123)) is None
+
+
+def test_sessao_ativa_mais_recente(armazenamento):
+    rodar(armazenamento.criar_sessao("s1", 9, 123, 1, "D&D 5e"))
+    time.sleep(0.01)
+    rodar(armazenamento.criar_sessao("s2", 9, 123, 1, "Tormenta"))
+    assert rodar(armazenamento.get_sessao_ativa(123))["sessao_id"] == "s2"
+
+
+def test_sessao_duplicada(armazenamento):
+    rodar(armazenamento.criar_sessao("s1", 9, 123, 1, "D&D 5e"))
+    with pytest.raises(FalhaArmazenamento):
+        rodar(armazenamento.criar_sessao("s1", 9, 123, 1, "D&D 5e"))
+
+
+# ========== COMBATE ==========
+
+PARTICIPANTES = [{"nome": "Thorin", "iniciativa": 17}, {"nome": "Goblin", "iniciativa": 9}]
+
+
+def test_combate_participantes_como_lista(armazenamento):
+    combate_id = rodar(armazenamento.iniciar_combate("s1", 123, PARTICIPANTES))
+
+    combate = rodar(armazenamento.get_combate_ativo(123))
+    assert combate["id"] == combate_id
+    assert combate["participantes"] == PARTICIPANTES
+    assert combate["participante_atual"] == "Thorin"
+    assert (combate["turno"], combate["rodada"]) == (1, 1)
+
+    novos = PARTICIPANTES + [{"nome": "Orc", "iniciativa": 5}]
+    assert rodar(armazenamento.atualizar_combate(combate_id, {
+        "turno": 2, "participante_atual": "Goblin", "participantes": novos,
+    }))
+
+    combate = rodar(armazenamento.get_combate_ativo("123"))
+    assert combate["participantes"] == novos
+    assert (combate["turno"], combate["participante_atual"]) == (2, "Goblin")
+
+
+def test_combate_nao_compartilha_lista(armazenamento):
+    participantes = [dict(p) for p in PARTICIPANTES]
+    rodar(armazenamento.iniciar_combate("s1", 123, participantes))
+    participantes[0]["nome"] = "Alterado"
+
+    combate = rodar(armazenamento.get_combate_ativo(123))
+    combate["participantes"].append({"nome": "Intruso"})
+
+    assert rodar(armazenamento.get_combate_ativo(123))["participantes"] == PARTICIPANTES
+
+
+def test_atualizar_combate_inexistente(armazenamento):
+    with pytest.raises(NaoEncontrado):
+        rodar(armazenamento.atualizar_combate(999, {"turno": 2}))
+
+
+def test_encerrar_combate(armazenamento):
+    assert rodar(armazenamento.get_combate_ativo(123)) is None
+    rodar(armazenamento.iniciar_combate("s1", 123, PARTICIPANTES))
+
+    assert rodar(armazenamento.encerrar_combate(123))
+    assert rodar(armazenamento.get_combate_ativo(123)) is None
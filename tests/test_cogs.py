@@ -0,0 +1,65 @@
+"""Cogs: erros do banco e inesperados respondidos pelo @adaptativo"""
+
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+import discord
+
+from armazenamento import FalhaArmazenamento
+from cogs.sessao import Sessao
+from execucao import ExecutorComandos
+
+
+class Resposta:
+    def __init__(self):
+        self.enviadas = []
+
+    def is_done(self):
+        return bool(self.enviadas)
+
+    async def send_message(self, *args, **kwargs):
+        self.enviadas.append((args, kwargs))
+
+
+class BancoQuebrado:
+    def __init__(self, erro):
+        self.erro = erro
+
+    async def get_sessao_ativa(self, canal_id):
+        raise self.erro
+
+
+class InteracaoFalsa(discord.Interaction):
+    # Sombreia slots e propriedades do discord.Interaction
+    id = client = command = created_at = guild_id = channel_id = channel = user = response = None
+
+    def __init__(self, **campos):
+        self.__dict__.update(campos)
+
+
+def interacao():
+    bot = SimpleNamespace(executor=ExecutorComandos(), sessoes_ativas={})
+    inter = InteracaoFalsa(
+        id=1, client=bot, command=SimpleNamespace(name="narrar"),
+        created_at=discord.utils.utcnow() + datetime.timedelta(seconds=5),
+        guild_id=9, channel_id=123, channel=SimpleNamespace(id=123),
+        user=SimpleNamespace(id=1, display_name="Ana"), response=Resposta(),
+    )
+    return bot, inter
+
+
+def narrar(erro):
+    bot, inter = interacao()
+    bot.db = BancoQuebrado(erro)
+    asyncio.run(Sessao.narrar.callback(Sessao(bot), inter, "ataco o goblin"))
+    ((args, _),) = inter.response.enviadas
+    return args[0]
+
+
+def test_narrar_falha_do_banco_vai_para_o_executor():
+    assert narrar(FalhaArmazenamento("x")).startswith("❌ Erro no banco de dados")
+
+
+def test_narrar_erro_inesperado_responde_no_comando():
+    assert narrar(RuntimeError("x")) == "❌ O mestre perdeu o fio da história. Tente novamente."
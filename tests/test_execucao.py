@@ -0,0 +1,120 @@
+"""Execução adaptativa: responder na hora, adiar pelo vigia ou antes do comando"""
+
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+from execucao import INTERACAO_DESCONHECIDA, ExecutorComandos
+
+# Prazos curtos para o teste não esperar os 3 segundos reais
+PRAZO = 0.3
+MARGEM = 0.1
+
+
+class Resposta:
+    def __init__(self, erro_defer=None):
+        self.erro_defer = erro_defer
+        self.eventos = []
+
+    def is_done(self):
+        return bool(self.eventos)
+
+    async def defer(self):
+        if self.erro_defer:
+            raise self.erro_defer
+        self.eventos.append(("defer", None))
+
+    async def send_message(self, conteudo):
+        self.eventos.append(("send_message", conteudo))
+
+
+class Followup:
+    def __init__(self):
+        self.enviadas = []
+
+    async def send(self, conteudo):
+        self.enviadas.append(conteudo)
+
+
+class InteracaoFalsa(discord.Interaction):
+    # Sombreia slots e propriedades do discord.Interaction
+    id = command = created_at = guild_id = channel_id = user = response = followup = None
+
+    def __init__(self, **campos):
+        self.__dict__.update(campos)
+
+
+def interacao(erro_defer=None):
+    return InteracaoFalsa(
+        id=1, command=SimpleNamespace(name="teste"), created_at=discord.utils.utcnow(),
+        guild_id=9, channel_id=123, user=SimpleNamespace(id=1),
+        response=Resposta(erro_defer), followup=Followup(),
+    )
+
+
+def comando(executor, inter, espera=0.0):
+    async def func():
+        await asyncio.sleep(espera)
+        await executor.enviar(inter, "pronto")
+    return func
+
+
+def executar(executor, inter, func):
+    asyncio.run(executor.executar("teste", func, inter))
+
+
+def test_comando_rapido_responde_sem_adiar():
+    executor = ExecutorComandos(prazo=PRAZO, margem=MARGEM)
+    inter = interacao()
+
+    executar(executor, inter, comando(executor, inter))
+
+    assert inter.response.eventos == [("send_message", "pronto")]
+    assert inter.followup.enviadas == []
+    assert executor.estatisticas["teste"]["adiados"] == 0
+    assert executor.estatisticas["teste"]["execucoes"] == 1
+
+
+def test_comando_lento_adiado_pelo_vigia():
+    executor = ExecutorComandos(prazo=PRAZO, margem=MARGEM)
+    inter = interacao()
+
+    executar(executor, inter, comando(executor, inter, espera=PRAZO + 0.05))
+
+    assert inter.response.eventos == [("defer", None)]
+    assert inter.followup.enviadas == ["pronto"]
+    assert executor.estatisticas["teste"]["adiados"] == 1
+
+
+def test_estimativa_alta_adia_antes_do_comando():
+    executor = ExecutorComandos(prazo=PRAZO, margem=MARGEM)
+    executor._registrar("teste", PRAZO)
+    inter = interacao()
+    visto = []
+
+    async def func():
+        visto.append(list(inter.response.eventos))
+        await executor.enviar(inter, "pronto")
+
+    executar(executor, inter, func)
+
+    assert visto == [[("defer", None)]]
+    assert inter.followup.enviadas == ["pronto"]
+    assert executor.estatisticas["teste"]["adiados"] == 1
+
+
+def test_interacao_expirada_conta_perda():
+    erro = discord.NotFound(
+        SimpleNamespace(status=404, reason="Not Found"),
+        {"code": INTERACAO_DESCONHECIDA, "message": "Unknown interaction"},
+    )
+    executor = ExecutorComandos(prazo=PRAZO, margem=MARGEM)
+    executor._registrar("teste", PRAZO)
+    inter = interacao(erro_defer=erro)
+
+    executar(executor, inter, comando(executor, inter))
+
+    stats = executor.estatisticas["teste"]
+    assert stats["perdas"] == 1
+    assert stats["adiados"] == 0
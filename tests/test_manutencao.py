@@ -0,0 +1,156 @@
+import asyncio
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import aiosqlite
+import pytest
+
+import manutencao
+from database import Database
+from manutencao import Manutencao, converter_auto_vacuum
+
+
+def _criar_banco(caminho, incremental):
+    conn = sqlite3.connect(caminho)
+    if incremental:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    conn.execute("CREATE TABLE lixo (dados TEXT)")
+    conn.executemany("INSERT INTO lixo VALUES (?)", [("x" * 2000,) for _ in range(2000)])
+    conn.commit()
+    conn.execute("DELETE FROM lixo")
+    conn.commit()
+    livres = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    conn.close()
+    return livres
+
+
+def test_otimizar_nao_faz_vacuum_completo_em_banco_antigo(tmp_path, caplog):
+    caminho = str(tmp_path / "antigo.db")
+    livres = _criar_banco(caminho, incremental=False)
+
+    liberadas = asyncio.run(Manutencao(None, caminho).otimizar())
+
+    assert liberadas == 0
+    assert sqlite3.connect(caminho).execute("PRAGMA freelist_count").fetchone()[0] == livres
+    assert "--converter" in caplog.text
+
+
+def test_otimizar_libera_em_blocos_limitados(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "novo.db")
+    livres = _criar_banco(caminho, incremental=True)
+    monkeypatch.setattr(manutencao, "PAGINAS_VACUUM_POR_PASSO", 100)
+    monkeypatch.setattr(manutencao, "PASSOS_VACUUM_POR_CICLO", 3)
+    monkeypatch.setattr(manutencao, "PAUSA_ENTRE_PASSOS", 0)
+
+    liberadas = asyncio.run(Manutencao(None, caminho).otimizar())
+
+    assert livres > 300
+    assert liberadas == 300
+
+
+def test_converter_auto_vacuum(tmp_path):
+    caminho = str(tmp_path / "antigo.db")
+    _criar_banco(caminho, incremental=False)
+
+    assert asyncio.run(converter_auto_vacuum(caminho))
+    assert sqlite3.connect(caminho).execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+# ========== ARQUIVAMENTO E BACKUP ==========
+
+def _banco_com_sessoes(tmp_path):
+    caminho = str(tmp_path / "rpg.db")
+    banco = Database(caminho)
+    antigo = (datetime.now() - timedelta(days=60)).isoformat()
+
+    async def preparar():
+        await banco.init_db()
+        for sessao_id, canal in (("velha", 1), ("recente", 2), ("ativa", 3)):
+            await banco.criar_sessao(sessao_id, 9, canal, 7, "D&D 5e")
+            await banco.iniciar_combate(sessao_id, canal, [{"nome": "Goblin"}])
+        await banco.encerrar_sessao(1)
+        await banco.encerrar_sessao(2)
+
+    asyncio.run(preparar())
+    conn = sqlite3.connect(caminho)
+    conn.execute("UPDATE sessoes SET updated_at = ? WHERE sessao_id IN ('velha', 'ativa')", (antigo,))
+    conn.commit()
+    conn.close()
+    return caminho
+
+
+def _sessoes(caminho, tabela="sessoes"):
+    conn = sqlite3.connect(caminho)
+    try:
+        return sorted(linha[0] for linha in conn.execute(f"SELECT sessao_id FROM {tabela}"))
+    finally:
+        conn.close()
+
+
+def test_arquivar_move_so_sessoes_encerradas_antigas(tmp_path):
+    caminho = _banco_com_sessoes(tmp_path)
+    arquivo = str(tmp_path / "arquivo.db")
+
+    arquivadas = asyncio.run(Manutencao(None, caminho, arquivo_path=arquivo).arquivar_sessoes())
+
+    assert arquivadas == 1
+    assert _sessoes(caminho) == ["ativa", "recente"]
+    assert _sessoes(caminho, "combate") == ["ativa", "recente"]
+    assert _sessoes(arquivo) == ["velha"]
+    assert _sessoes(arquivo, "combate") == ["velha"]
+
+
+def test_arquivar_e_atomico(tmp_path):
+    caminho = _banco_com_sessoes(tmp_path)
+    arquivo = str(tmp_path / "arquivo.db")
+    # Tabela de combate incompatível no arquivo: a cópia falha no meio
+    conn = sqlite3.connect(arquivo)
+    conn.execute("CREATE TABLE combate (id INTEGER PRIMARY KEY)")
+    conn.close()
+
+    with pytest.raises(sqlite3.Error):
+        asyncio.run(Manutencao(None, caminho, arquivo_path=arquivo).arquivar_sessoes())
+
+    assert _sessoes(caminho) == ["ativa", "recente", "velha"]
+    assert _sessoes(caminho, "combate") == ["ativa", "recente", "velha"]
+    assert _sessoes(arquivo) == []
+
+
+def test_backup_gera_copia_legivel(tmp_path):
+    caminho = _banco_com_sessoes(tmp_path)
+    pasta = str(tmp_path / "backups")
+
+    destino = asyncio.run(Manutencao(None, caminho, pasta_backups=pasta).fazer_backup())
+
+    assert _sessoes(destino) == ["ativa", "recente", "velha"]
+    assert os.listdir(pasta) == [os.path.basename(destino)]
+
+
+def test_backup_mantem_so_os_mais_recentes(tmp_path):
+    caminho = _banco_com_sessoes(tmp_path)
+    pasta = tmp_path / "backups"
+    pasta.mkdir()
+    for dia in range(1, manutencao.BACKUPS_MANTIDOS + 3):
+        (pasta / f"rpg_campanhas_200001{dia:02d}000000.db").write_bytes(b"")
+
+    destino = asyncio.run(Manutencao(None, caminho, pasta_backups=str(pasta)).fazer_backup())
+
+    restantes = sorted(os.listdir(pasta))
+    assert len(restantes) == manutencao.BACKUPS_MANTIDOS
+    assert restantes[-1] == os.path.basename(destino)
+
+
+def test_backup_com_erro_nao_deixa_parcial(tmp_path, monkeypatch):
+    caminho = _banco_com_sessoes(tmp_path)
+    pasta = str(tmp_path / "backups")
+
+    async def backup_quebrado(self, *args, **kwargs):
+        raise sqlite3.OperationalError("disco cheio")
+
+    monkeypatch.setattr(aiosqlite.Connection, "backup", backup_quebrado)
+
+    with pytest.raises(sqlite3.OperationalError):
+        asyncio.run(Manutencao(None, caminho, pasta_backups=pasta).fazer_backup())
+
+    assert os.listdir(pasta) == []
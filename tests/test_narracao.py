@@ -0,0 +1,86 @@
+import json
+import re
+
+import pytest
+
+from narracao import CORPUS_PADRAO, Narrador, chave_sistema
+
+
+@pytest.fixture
+def narrador():
+    return Narrador()
+
+
+@pytest.mark.parametrize("acao, sistema, esperado", [
+    ("Lanço bola de fogo", "D&D 5e", "magia"),
+    ("Eu lanço um feitiço", None, "magia"),
+    ("Peço socorro aos guardas", None, "social"),
+    ("Uso minha mente", None, None),
+    ("Portanto, fico parado", None, None),
+    ("Ataco o orc com a espada", None, "combate"),
+    ("Dou um soco no bandido", None, "combate"),
+    ("Me escondo nas sombras", None, "furtividade"),
+    ("Tento convencer o guarda", None, "social"),
+    ("Abro a porta devagar", None, "exploracao"),
+    ("Faço um ataque furtivo", "D&D 5e", "combate"),
+])
+def test_classificacao(narrador, acao, sistema, esperado):
+    assert narrador.corpus(sistema).classificar(acao) == esperado
+
+
+def test_expressao_longa_vence_radical_curto(narrador):
+    # 'atac' (combate) contra 'bola de fogo' (magia): a expressão mais longa decide
+    assert narrador.corpus("D&D 5e").classificar("Ataco com bola de fogo") == "magia"
+
+
+def test_narrar_preenche_contexto(narrador):
+    categoria, texto = narrador.narrar("Ataco o goblin", "D&D 5e", personagem="Thorin",
+                                       classe="Guerreiro", raca="Anão", campanha="A Mina")
+    assert categoria == "combate"
+    assert "{" not in texto
+
+
+def test_narrar_sem_contexto_usa_padroes(narrador):
+    _, texto = narrador.narrar("blablabla", jogador="Ana")
+    assert "{" not in texto
+
+
+@pytest.mark.parametrize("chave", sorted(Narrador().disponiveis()))
+def test_modelos_usam_so_campos_conhecidos(chave):
+    campos = {"acao", "sistema", "personagem", "jogador", "classe", "raca", "campanha"}
+    modelos = Narrador().corpus(chave).modelos
+    for categoria, lista in modelos.items():
+        assert len(lista) == len(set(lista)), categoria
+        for modelo in lista:
+            usados = set(re.findall(r"{(\w+)}", modelo))
+            assert usados <= campos, modelo
+
+
+@pytest.mark.parametrize("sistema, chave", [
+    ("D&D 5e", "dnd5e"),
+    ("dnd", "dnd5e"),
+    (None, CORPUS_PADRAO),
+    ("../../etc/x", "etcx"),
+    ("///", CORPUS_PADRAO),
+])
+def test_chave_sistema(sistema, chave):
+    assert chave_sistema(sistema) == chave
+
+
+def test_sistema_fora_da_pasta_nao_e_lido(tmp_path, monkeypatch):
+    pasta = tmp_path / "evil"
+    pasta.mkdir()
+    (pasta / "x.json").write_text(json.dumps({"palavras_chave": {}, "modelos": {"neutro": ["PWNED"]}}))
+    monkeypatch.chdir(tmp_path)
+
+    narrador = Narrador()
+    corpus = narrador.corpus("../evil/x")
+    assert corpus.nome == CORPUS_PADRAO
+    _, texto = narrador.narrar("nada", "../evil/x")
+    assert texto != "PWNED"
+
+
+def test_sistemas_desconhecidos_nao_crescem_o_cache(narrador):
+    for i in range(50):
+        narrador.corpus(f"Sistema Inventado {i}")
+    assert set(narrador._corpora) == {CORPUS_PADRAO}
@@ -0,0 +1,49 @@
+"""Logs estruturados: limite de repetição e relatório do que foi suprimido"""
+
+import io
+import json
+import logging
+
+import registro
+from registro import LimiteRepeticao
+
+
+def registro_erro(msg, *args):
+    return logging.LogRecord("teste", logging.ERROR, __file__, 1, msg, args, None)
+
+
+def test_limite_agrupa_por_mensagem_sem_argumentos():
+    limite = LimiteRepeticao(limite=2, janela=60)
+    passaram = [limite.filter(registro_erro("Falha em %s", i)) for i in range(5)]
+    assert passaram == [True, True, False, False, False]
+
+
+def test_descarregar_so_janelas_vencidas():
+    limite = LimiteRepeticao(limite=1, janela=60)
+    for _ in range(4):
+        limite.filter(registro_erro("Falha"))
+
+    assert limite.descarregar() == []
+    assert limite.descarregar(tudo=True) == [("teste", "Falha", None, 3)]
+    assert limite.descarregar(tudo=True) == []
+
+
+def test_encerrar_reporta_suprimidos():
+    saida = io.StringIO()
+    raiz = logging.getLogger()
+    handlers, nivel = raiz.handlers[:], raiz.level
+    registro.configurar(saida=saida)
+    try:
+        log = logging.getLogger("teste.registro")
+        for i in range(registro.REPETICOES_POR_JANELA + 3):
+            log.error("Erro repetido %d", i)
+    finally:
+        registro.encerrar()
+        raiz.handlers, raiz.level = handlers, nivel
+
+    linhas = [json.loads(linha) for linha in saida.getvalue().splitlines()]
+    assert len(linhas) == registro.REPETICOES_POR_JANELA + 1
+    resumo = linhas[-1]
+    assert resumo["nivel"] == "WARNING"
+    assert resumo["suprimidos"] == 3
+    assert "Erro repetido %d" in resumo["msg"]
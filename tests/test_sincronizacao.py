@@ -0,0 +1,96 @@
+"""Sincronização incremental: só o que mudou vai para o Discord"""
+
+import asyncio
+
+import discord
+import pytest
+from discord import app_commands
+
+import bot as modulo_bot
+from armazenamento import ArmazenamentoMemoria
+from bot import MestreRPGBot
+
+
+class HttpFalso:
+    def __init__(self):
+        self.upserts = []
+
+    async def upsert_global_command(self, application_id, payload):
+        self.upserts.append(payload["name"])
+
+
+class ComandoRemoto:
+    def __init__(self, name, apagados):
+        self.name = name
+        self._apagados = apagados
+
+    async def delete(self):
+        self._apagados.append(self.name)
+
+
+def criar_comando(nome, descricao="Teste"):
+    async def callback(interaction: discord.Interaction):
+        pass
+    return app_commands.Command(name=nome, description=descricao, callback=callback)
+
+
+@pytest.fixture
+def cliente(tmp_path, monkeypatch):
+    monkeypatch.setattr(modulo_bot, "ASSINATURAS_PATH", str(tmp_path / "assinaturas.json"))
+    bot = MestreRPGBot(ArmazenamentoMemoria())
+    bot.http = HttpFalso()
+    bot.sincronizacoes = 0
+    bot.apagados = []
+
+    async def sync():
+        bot.sincronizacoes += 1
+
+    async def fetch_commands():
+        # O que o Discord conhece: o que estava na última sincronização
+        return [ComandoRemoto(nome, bot.apagados) for nome in ("rolar", "ficha")]
+
+    monkeypatch.setattr(bot.tree, "sync", sync)
+    monkeypatch.setattr(bot.tree, "fetch_commands", fetch_commands)
+    bot.tree.add_command(criar_comando("rolar"))
+    bot.tree.add_command(criar_comando("ficha"))
+    return bot
+
+
+def sincronizar(bot):
+    return asyncio.run(bot.sincronizar())
+
+
+def test_primeira_execucao_sincroniza_tudo(cliente):
+    alterados, removidos = sincronizar(cliente)
+
+    assert cliente.sincronizacoes == 1
+    assert cliente.http.upserts == []
+    assert sorted(alterados) == ["ficha", "rolar"]
+    assert removidos == []
+
+
+def test_arvore_igual_nao_envia_nada(cliente):
+    sincronizar(cliente)
+
+    assert sincronizar(cliente) == ([], [])
+    assert cliente.sincronizacoes == 1
+    assert cliente.http.upserts == []
+
+
+def test_comando_alterado_gera_um_upsert(cliente):
+    sincronizar(cliente)
+    cliente.tree.remove_command("ficha")
+    cliente.tree.add_command(criar_comando("ficha", "Nova descrição"))
+
+    assert sincronizar(cliente) == (["ficha"], [])
+    assert cliente.http.upserts == ["ficha"]
+    assert cliente.sincronizacoes == 1
+
+
+def test_comando_removido_e_apagado(cliente):
+    sincronizar(cliente)
+    cliente.tree.remove_command("ficha")
+
+    assert sincronizar(cliente) == ([], ["ficha"])
+    assert cliente.apagados == ["ficha"]
+    assert cliente.http.upserts == []